@@ -10,97 +10,264 @@ even number, as well as analyzing patterns across ranges of even numbers.
 Author: https://github.com/686f6c6
 """
 
-from prime_utils import generate_primes, is_prime
+from functools import lru_cache
+
+import numpy as np
+
+from prime_utils import is_prime, prime_sieve
+
+# Residues coprime to 30: every prime above 5 falls on one of these spokes,
+# so generating candidates as k*30 + _WHEEL30 discards 73% of integers upfront
+_WHEEL30 = np.array([1, 7, 11, 13, 17, 19, 23, 29])
+
+# Above this, find_goldbach_pairs stops materializing a full sieve and walks
+# wheel-30 candidates tested with is_prime (Miller-Rabin at this scale) instead
+_WHEEL_FALLBACK_LIMIT = 10_000_000
+
+def _pairs_from_sieve(even_number, sieve):
+    """
+    Enumerate Goldbach pairs for an even number using a prebuilt primality sieve.
+
+    This helper contains the shared hot path for find_goldbach_pairs and
+    analyze_goldbach_range. The condition "i is prime and even_number - i is
+    prime" is evaluated for every candidate at once as a single bitwise AND of
+    the lower half of the sieve against a reversed view of the upper half —
+    one SIMD-friendly pass over contiguous memory, with no per-candidate
+    Python work and no index gather.
+
+    Args:
+        even_number (int): An even number greater than 2
+        sieve (numpy.ndarray): Boolean primality table covering [0, even_number]
+
+    Returns:
+        list: List of tuples (p1, p2) with p1 + p2 = even_number and p1 <= p2
+    """
+    half = even_number // 2
+    left = sieve[2:half + 1]
+    right = sieve[even_number - 2:even_number - half - 1:-1]
+    matched = np.flatnonzero(left & right) + 2
+    return list(zip(matched.tolist(), (even_number - matched).tolist()))
+
+def _pairs_by_wheel(even_number):
+    """
+    Enumerate Goldbach pairs without a sieve, walking wheel-30 candidates.
+
+    Used for even numbers too large to justify allocating a [0, n] primality
+    table: candidates in [7, n/2] are generated on the residues coprime to 30
+    — a priori eliminating multiples of 2, 3 and 5, i.e. 22 of every 30
+    integers — and each surviving candidate and its complement are tested with
+    is_prime, which at this magnitude is deterministic Miller-Rabin. The
+    primes 2, 3 and 5 sit outside the wheel and are checked explicitly.
+
+    Args:
+        even_number (int): An even number greater than 2
+
+    Returns:
+        list: List of tuples (p1, p2) with p1 + p2 = even_number and p1 <= p2
+    """
+    half = even_number // 2
+    pairs = [(p, even_number - p) for p in (2, 3, 5)
+             if p <= half and is_prime(even_number - p)]
+
+    spokes = np.arange(half // 30 + 1)[:, None] * 30 + _WHEEL30
+    candidates = spokes.ravel()
+    candidates = candidates[(candidates >= 7) & (candidates <= half)]
+    for candidate in candidates.tolist():
+        if is_prime(candidate) and is_prime(even_number - candidate):
+            pairs.append((candidate, even_number - candidate))
+    return pairs
+
+def _pairs_from_prime_index(even_number, prime_idx, sieve):
+    """
+    Enumerate Goldbach pairs using a precomputed sorted array of primes.
+
+    Range analysis calls this once per even number: instead of scanning half
+    the sieve per number (as _pairs_from_sieve does), the candidates are cut
+    out of the shared prime index with one binary search and only their
+    complements are gathered from the sieve — π(n/2) touches instead of n/2.
+
+    Args:
+        even_number (int): An even number greater than 2
+        prime_idx (numpy.ndarray): Sorted array of all primes up to at least even_number
+        sieve (numpy.ndarray): Boolean primality table covering [0, even_number]
+
+    Returns:
+        list: List of tuples (p1, p2) with p1 + p2 = even_number and p1 <= p2
+    """
+    half_count = np.searchsorted(prime_idx, even_number // 2, side='right')
+    candidates = prime_idx[:half_count]
+    matched = candidates[sieve[even_number - candidates]]
+    return list(zip(matched.tolist(), (even_number - matched).tolist()))
+
+def _pair_counts_up_to(end, sieve):
+    """
+    Compute Goldbach pair counts for every number up to end in one batch.
+
+    The count of ordered prime pairs (p, q) with p + q = n is the n-th
+    coefficient of the prime indicator vector convolved with itself, so all
+    counts are obtained at once as an FFT-based autoconvolution running in C —
+    O(N log N) total instead of enumerating pairs per number. The ordered
+    counts are then folded to unordered pairs with p <= q, adding the (p, p)
+    self-pair back in for numbers whose half is prime.
+
+    Args:
+        end (int): Upper bound of the numbers to count pairs for (inclusive)
+        sieve (numpy.ndarray): Boolean primality table covering [0, end]
+
+    Returns:
+        numpy.ndarray: Integer array where index n holds the number of prime
+                       pairs (p1, p2) with p1 + p2 = n and p1 <= p2
+    """
+    indicator = sieve[:end + 1].astype(np.float64)
+    # Zero-pad to the full linear-convolution length so sums beyond end
+    # cannot wrap around circularly into the counts we read back
+    fft_size = 2 * end + 2
+    spectrum = np.fft.rfft(indicator, n=fft_size)
+    ordered = np.rint(np.fft.irfft(spectrum * spectrum, n=fft_size)[:end + 1])
+    ordered = ordered.astype(np.int64)
+
+    # Fold ordered (p, q) counts into unordered p <= q: self-pairs (p, p)
+    # appear once in the convolution, every other pair twice
+    halves = np.zeros(end + 1, dtype=np.int64)
+    halves[::2] = sieve[:end // 2 + 1]
+    return (ordered + halves) // 2
 
 def find_goldbach_pairs(even_number):
     """
     Find all pairs of prime numbers that sum to the given even number.
     
     This function implements an optimized algorithm for finding Goldbach pairs:
-    1. It only searches for primes up to even_number - 1
+    1. It uses the cached primality sieve from prime_utils, built at most once per limit
     2. It only checks prime candidates up to even_number/2 (since pairs are symmetric)
-    3. For each prime p, it checks if (even_number - p) is also prime
-    
+    3. For each prime p, testing whether (even_number - p) is prime is a table lookup
+
     Args:
         even_number (int): An even number greater than 2
-        
+
     Returns:
         list: List of tuples containing pairs of primes (p1, p2) where p1 + p2 = even_number
               and p1 <= p2 (to avoid duplicate pairs)
-    
-    Time Complexity: O(π(n) * log(n)) where π(n) is the prime-counting function
+
+    Time Complexity: O(n) lookups after the amortized sieve construction
     Space Complexity: O(π(n))
     """
     if even_number <= 2 or even_number % 2 != 0:
         return []
-    
-    pairs = []
-    # We only need to check primes up to even_number
-    primes = generate_primes(even_number - 1)
-    
-    # Optimization: we only need to check up to even_number/2
-    for prime in primes:
-        if prime > even_number // 2:
-            break
-        
-        # If even_number - prime is also prime, we found a pair
-        complement = even_number - prime
-        if is_prime(complement):
-            pairs.append((prime, complement))
-    
-    return pairs
+
+    # Beyond the sieve limit, switch to the wheel-30 candidate walk so huge
+    # inputs never allocate an O(n) primality table
+    if even_number > _WHEEL_FALLBACK_LIMIT:
+        return _pairs_by_wheel(even_number)
+
+    # One cached sieve covers both the candidates and their complements
+    return _pairs_from_sieve(even_number, prime_sieve(even_number))
 
 def count_goldbach_pairs(even_number):
     """
     Count the number of prime pairs that sum to the given even number.
     
-    This is a convenience function that leverages find_goldbach_pairs() and returns
-    just the count. For performance-critical applications where only the count is needed,
-    a more optimized implementation could be created that doesn't store the actual pairs.
-    
+    Unlike find_goldbach_pairs(), this never materializes the pair tuples: the
+    count is the population of the same sieve-view AND used for enumeration,
+    summed directly in C. That avoids the per-pair allocation cost entirely,
+    which dominates when only the count is consumed. Inputs beyond the sieve
+    limit take the same wheel-30 walk as enumeration, so counting huge numbers
+    never allocates an O(n) primality table either.
+
     Args:
         even_number (int): An even number greater than 2
-        
+
     Returns:
         int: Number of prime pairs that sum to even_number
-    
-    Time Complexity: Same as find_goldbach_pairs()
-    Space Complexity: Same as find_goldbach_pairs()
+
+    Time Complexity: O(n) after the amortized sieve construction
+    Space Complexity: O(1) beyond the shared sieve
     """
-    return len(find_goldbach_pairs(even_number))
+    if even_number <= 2 or even_number % 2 != 0:
+        return 0
 
-def analyze_goldbach_range(start, end):
+    if even_number > _WHEEL_FALLBACK_LIMIT:
+        return len(_pairs_by_wheel(even_number))
+
+    sieve = prime_sieve(even_number)
+    half = even_number // 2
+    left = sieve[2:half + 1]
+    right = sieve[even_number - 2:even_number - half - 1:-1]
+    return int(np.count_nonzero(left & right))
+
+def analyze_goldbach_range(start, end, include_pairs=True):
     """
     Analyze Goldbach conjecture for a range of even numbers.
-    
+
     This function processes a range of even numbers and computes all Goldbach pairs
     for each number in the range. It returns two data structures:
     1. A dictionary mapping each even number to its list of prime pairs
     2. A dictionary mapping each even number to the count of prime pairs
-    
+
     The function automatically handles odd start values by incrementing to the next even number.
-    
+    A single sieve covering the whole range is built up front, so the per-number work
+    reduces to table lookups instead of recomputing primality from scratch.
+
     Args:
         start (int): Start of range (must be > 2, will be adjusted to even if odd)
         end (int): End of range (inclusive)
-        
+        include_pairs (bool): When False, skip materializing the per-number pair
+                              lists and return an empty pairs_dict. Counts come
+                              from the batched convolution either way, so
+                              count-only consumers (e.g. the histogram) avoid
+                              all per-pair tuple allocation.
+
     Returns:
         tuple: Contains two dictionaries:
-               - pairs_dict: {even_number: [(p1, p2), ...], ...}
+               - pairs_dict: {even_number: [(p1, p2), ...], ...} ({} when
+                 include_pairs is False)
                - counts_dict: {even_number: count, ...}
-    
-    Time Complexity: O(n * π(n) * log(n)) where n is the range size
+
+    Time Complexity: O(n^2) lookups after one O(n log log n) sieve construction
     Space Complexity: O(n * π(n))
     """
     if start % 2 != 0:
         start += 1  # Ensure start is even
-    
+
     pairs_dict = {}
     counts_dict = {}
-    
+
+    # Build the sieve once for the whole range instead of once per number,
+    # and batch-compute every count with one FFT autoconvolution
+    sieve = prime_sieve(end)
+    counts = _pair_counts_up_to(end, sieve)
+
+    # One shared prime index serves every number in the range, so the per-number
+    # work shrinks to a binary search plus a gather over π(n/2) candidates
+    prime_idx = np.flatnonzero(sieve[:end + 1]) if include_pairs else None
+
     for num in range(max(4, start), end + 1, 2):  # Step by 2 to get only even numbers
-        pairs = find_goldbach_pairs(num)
-        pairs_dict[num] = pairs
-        counts_dict[num] = len(pairs)
-    
+        if include_pairs:
+            pairs_dict[num] = _pairs_from_prime_index(num, prime_idx, sieve)
+        counts_dict[num] = int(counts[num])
+
     return pairs_dict, counts_dict
+
+@lru_cache(maxsize=32)
+def analyze_goldbach_range_cached(start, end, include_pairs=True):
+    """
+    Memoized front-end for analyze_goldbach_range.
+
+    Repeated queries for the same range (common when users re-run an analysis
+    after switching tabs) return the previously computed dictionaries instantly
+    instead of re-enumerating pairs. Combined with the growing sieve cache this
+    makes overlapping queries cheap as well, since only the pair lists are
+    rebuilt for a new range.
+
+    Args:
+        start (int): Start of range (must be > 2, will be adjusted to even if odd)
+        end (int): End of range (inclusive)
+        include_pairs (bool): Forwarded to analyze_goldbach_range
+
+    Returns:
+        tuple: Same (pairs_dict, counts_dict) as analyze_goldbach_range
+
+    Note:
+        The returned dictionaries are shared cache entries and must not be
+        modified by callers.
+    """
+    return analyze_goldbach_range(start, end, include_pairs)
@@ -8,14 +8,17 @@ as the sum of two prime numbers, with various visualization options.
 Author: https://github.com/686f6c6
 """
 
+import os
 import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import freeze_support
 from tkinter import ttk, messagebox, scrolledtext
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
 
 from prime_utils import is_prime, generate_primes
-from goldbach import find_goldbach_pairs, count_goldbach_pairs, analyze_goldbach_range
+from goldbach import find_goldbach_pairs, count_goldbach_pairs, analyze_goldbach_range_cached
 from visualization import create_scatter_plot, create_histogram, embed_plot_in_tkinter
 
 class GoldbachApp:
@@ -49,9 +52,34 @@ class GoldbachApp:
         # Create main container
         self.main_frame = ttk.Frame(self.root, padding=10)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
+
+        # Worker pool for CPU-bound analysis, created lazily on first use so
+        # the sieve work runs outside the Tk event loop (and outside the GIL)
+        self._executor = None
+        self._range_futures = None
+        self._range_key = None
+
+        # Completed range analyses keyed by (start, end): re-running a query
+        # (e.g. after switching tabs) redraws instantly from the cached result
+        self._range_cache = {}
+
         # Show welcome screen initially
         self.show_welcome_screen()
+
+    def _get_executor(self):
+        """
+        Return the shared process pool, creating it on first use.
+
+        A ProcessPoolExecutor is used rather than threads so the CPU-bound
+        sieve and pair enumeration scale across cores instead of contending
+        for the GIL with the GUI.
+
+        Returns:
+            ProcessPoolExecutor: The lazily created worker pool
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        return self._executor
     
     def open_github_link(self):
         """
@@ -188,93 +216,158 @@ Esta aplicación te permite:
         )
         analyze_button.pack(side=tk.LEFT, padx=5)
         
-        # Results frame
+        # Results frame; its widgets are created lazily by the first analysis
+        # and then updated in place by subsequent ones
         self.results_frame = ttk.Frame(self.main_frame)
         self.results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-    
+
+        if getattr(self, '_single_fig', None) is not None:
+            plt.close(self._single_fig)
+        self._single_fig = None
+        self._single_ready = False
+
+    def _build_single_result_widgets(self):
+        """
+        Create the persistent result widgets for the single-number screen.
+
+        The text panel, figure, canvas and toolbar are built once per visit to
+        the screen and reused by every analysis, so re-running only updates
+        artist data instead of rebuilding and re-rasterizing a fresh canvas.
+        A handle to the rendered background is cached on every full draw so
+        unchanged re-analyses can blit just the data artists over it.
+        """
+        # Text results
+        text_frame = ttk.LabelFrame(self.results_frame, text="Resultados")
+        text_frame.pack(fill=tk.BOTH, expand=True, side=tk.LEFT, padx=5, pady=5)
+
+        self._single_text = scrolledtext.ScrolledText(
+            text_frame,
+            wrap=tk.WORD,
+            width=30,
+            height=15
+        )
+        self._single_text.configure(state='disabled')
+        self._single_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Visualization
+        viz_frame = ttk.LabelFrame(self.results_frame, text="Visualización")
+        viz_frame.pack(fill=tk.BOTH, expand=True, side=tk.RIGHT, padx=5, pady=5)
+
+        self._single_fig = plt.figure(figsize=(6, 5))
+        self._single_fig.set_tight_layout(True)
+
+        # Scatter plot of prime pairs, created empty and filled per analysis
+        ax = self._single_fig.add_subplot(111)
+        ax.set_xlabel('Primer Primo')
+        ax.set_ylabel('Segundo Primo')
+        ax.grid(True, alpha=0.3)
+        self._single_ax = ax
+        self._single_scatter = ax.scatter([], [], color='blue', alpha=0.7)
+        self._single_annotations = []
+
+        # Embed plot in tkinter
+        self._single_canvas = FigureCanvasTkAgg(self._single_fig, master=viz_frame)
+        self._single_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Add toolbar
+        toolbar = NavigationToolbar2Tk(self._single_canvas, viz_frame)
+        toolbar.update()
+
+        self._single_bg = None
+        self._single_number = None
+        self._single_canvas.mpl_connect(
+            'draw_event',
+            lambda event: self._cache_single_background()
+        )
+
+    def _cache_single_background(self):
+        """
+        Snapshot the rendered axes background after a full canvas draw.
+
+        The snapshot is what restore_region pastes back during the blit fast
+        path, and re-capturing it on every draw_event keeps it valid across
+        resizes and toolbar interactions.
+        """
+        self._single_bg = self._single_canvas.copy_from_bbox(self._single_ax.bbox)
+
     def analyze_single_number(self):
         """
         Process and display results for a single even number analysis.
-        
+
         This method:
         1. Validates user input
         2. Finds all prime pairs that sum to the given even number
         3. Displays the results in text format
-        4. Creates and displays a scatter plot visualization
+        4. Updates the persistent scatter plot with the pairs — re-analyzing
+           the same number blits only the data artists over the cached
+           background instead of re-rasterizing the whole figure
         """
         try:
             number = int(self.number_entry.get())
-            
+
             if number <= 2:
                 messagebox.showerror("Error", "El número debe ser mayor que 2")
                 return
-            
+
             if number % 2 != 0:
                 messagebox.showerror("Error", "El número debe ser par")
                 return
-            
-            # Clear previous results
-            for widget in self.results_frame.winfo_children():
-                widget.destroy()
-            
+
             # Find Goldbach pairs
             pairs = find_goldbach_pairs(number)
-            
+
             if not pairs:
                 messagebox.showerror("Error", f"No se encontraron pares para {number}")
                 return
-            
+
+            if not self._single_ready:
+                self._build_single_result_widgets()
+                self._single_ready = True
+
             # Display results
             result_text = f"Se encontraron {len(pairs)} pares de números primos que suman {number}:\n\n"
             for p1, p2 in pairs:
                 result_text += f"{p1} + {p2} = {number}\n"
-            
-            # Text results
-            text_frame = ttk.LabelFrame(self.results_frame, text="Resultados")
-            text_frame.pack(fill=tk.BOTH, expand=True, side=tk.LEFT, padx=5, pady=5)
-            
-            result_text_widget = scrolledtext.ScrolledText(
-                text_frame, 
-                wrap=tk.WORD,
-                width=30,
-                height=15
-            )
-            result_text_widget.insert(tk.INSERT, result_text)
-            result_text_widget.configure(state='disabled')
-            result_text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            
-            # Visualization
-            viz_frame = ttk.LabelFrame(self.results_frame, text="Visualización")
-            viz_frame.pack(fill=tk.BOTH, expand=True, side=tk.RIGHT, padx=5, pady=5)
-            
-            # Create figure for the plot
-            fig = plt.figure(figsize=(6, 5))
-            
-            # Scatter plot of prime pairs
-            ax = fig.add_subplot(111)
-            x_values = [pair[0] for pair in pairs]
-            y_values = [pair[1] for pair in pairs]
-            ax.scatter(x_values, y_values, color='blue', alpha=0.7)
-            
-            # Add labels for each point
-            for i, (x, y) in enumerate(zip(x_values, y_values)):
-                ax.annotate(f"({x},{y})", (x, y), textcoords="offset points", 
-                           xytext=(0, 5), ha='center')
-            
-            ax.set_xlabel('Primer Primo')
-            ax.set_ylabel('Segundo Primo')
+
+            self._single_text.configure(state='normal')
+            self._single_text.delete('1.0', tk.END)
+            self._single_text.insert(tk.INSERT, result_text)
+            self._single_text.configure(state='disabled')
+
+            ax = self._single_ax
+
+            if number == self._single_number and self._single_bg is not None:
+                # Same data and axes: paste the cached background back and
+                # re-render only the data artists, skipping ticks and grid
+                self._single_canvas.restore_region(self._single_bg)
+                ax.draw_artist(self._single_scatter)
+                for annotation in self._single_annotations:
+                    ax.draw_artist(annotation)
+                self._single_canvas.blit(ax.bbox)
+                return
+
+            # Update the scatter offsets and point labels in place
+            points = np.array(pairs)
+            self._single_scatter.set_offsets(points)
+            for annotation in self._single_annotations:
+                annotation.remove()
+            self._single_annotations = [
+                ax.annotate(f"({x},{y})", (x, y), textcoords="offset points",
+                            xytext=(0, 5), ha='center')
+                for x, y in pairs
+            ]
             ax.set_title(f'Pares de primos que suman {number}')
-            ax.grid(True, alpha=0.3)
-            
-            # Embed plot in tkinter
-            canvas = FigureCanvasTkAgg(fig, master=viz_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Add toolbar
-            toolbar = NavigationToolbar2Tk(canvas, viz_frame)
-            toolbar.update()
-            
+
+            # Rescale manually: relim() ignores collections, so derive the
+            # limits from the data with a small margin
+            x_margin = 0.05 * max(int(points[:, 0].max() - points[:, 0].min()), 1)
+            y_margin = 0.05 * max(int(points[:, 1].max() - points[:, 1].min()), 1)
+            ax.set_xlim(points[:, 0].min() - x_margin, points[:, 0].max() + x_margin)
+            ax.set_ylim(points[:, 1].min() - y_margin, points[:, 1].max() + y_margin)
+
+            self._single_number = number
+            self._single_canvas.draw()
+
         except ValueError:
             messagebox.showerror("Error", "Por favor ingrese un número válido")
     
@@ -326,9 +419,16 @@ Esta aplicación te permite:
         )
         analyze_button.pack(side=tk.LEFT, padx=5)
         
-        # Results frame
+        # Results frame; the notebook and its canvases are created lazily by
+        # the first analysis and refreshed in place by subsequent ones
         self.range_results_frame = ttk.Frame(self.main_frame)
         self.range_results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        for figure_attr in ('_scatter_fig', '_histogram_fig'):
+            if getattr(self, figure_attr, None) is not None:
+                plt.close(getattr(self, figure_attr))
+                setattr(self, figure_attr, None)
+        self._range_ready = False
     
     def analyze_range(self):
         """
@@ -336,96 +436,197 @@ Esta aplicación te permite:
         
         This method:
         1. Validates user input for the range
-        2. Analyzes all even numbers in the specified range
-        3. Creates and displays multiple visualizations:
-           - Scatter plot of prime pairs
-           - Histogram of pair counts
-           - Data table with detailed information
+        2. Submits the analysis to the worker pool, partitioned into one
+           sub-range per core, so the Tk event loop never blocks
+        3. Polls the futures with root.after and, once all chunks finish,
+           merges and displays the results
         """
         try:
             start = int(self.start_entry.get())
             end = int(self.end_entry.get())
-            
+
             if start < 4:
                 start = 4  # Ensure start is at least 4
-            
+
+            # Normalize to even before partitioning: the chunk boundary
+            # arithmetic assumes an even start, and an odd one would shift
+            # every boundary onto an odd number, dropping one even per chunk
+            start += start % 2
+
             if end < start:
                 messagebox.showerror("Error", "El valor final debe ser mayor que el inicial")
                 return
-            
-            if end > 100:
-                response = messagebox.askquestion(
-                    "Advertencia", 
-                    "Analizar un rango grande puede llevar tiempo. ¿Desea continuar?"
-                )
-                if response != 'yes':
-                    return
-            
-            # Clear previous results
-            for widget in self.range_results_frame.winfo_children():
-                widget.destroy()
-            
-            # Analyze range
-            pairs_dict, counts_dict = analyze_goldbach_range(start, end)
-            
-            if not pairs_dict:
-                messagebox.showerror("Error", "No se encontraron resultados para el rango especificado")
+
+            if self._range_futures is not None:
+                return  # An analysis is already in flight
+
+            # Serve repeated queries straight from the cache
+            cached = self._range_cache.get((start, end))
+            if cached is not None:
+                self._display_range_results(*cached)
                 return
-            
-            # Create notebook for tabs
-            notebook = ttk.Notebook(self.range_results_frame)
-            notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            
-            # Tab 1: Scatter Plot
-            scatter_tab = ttk.Frame(notebook)
-            notebook.add(scatter_tab, text="Gráfico de Dispersión")
-            
-            scatter_fig = create_scatter_plot(pairs_dict)
-            scatter_canvas = FigureCanvasTkAgg(scatter_fig, master=scatter_tab)
-            scatter_canvas.draw()
-            scatter_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Add toolbar
-            scatter_toolbar = NavigationToolbar2Tk(scatter_canvas, scatter_tab)
-            scatter_toolbar.update()
-            
-            # Tab 2: Histogram
-            histogram_tab = ttk.Frame(notebook)
-            notebook.add(histogram_tab, text="Histograma")
-            
-            histogram_fig = create_histogram(counts_dict)
-            histogram_canvas = FigureCanvasTkAgg(histogram_fig, master=histogram_tab)
-            histogram_canvas.draw()
-            histogram_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Add toolbar
-            histogram_toolbar = NavigationToolbar2Tk(histogram_canvas, histogram_tab)
-            histogram_toolbar.update()
-            
-            # Tab 3: Data Table
-            table_tab = ttk.Frame(notebook)
-            notebook.add(table_tab, text="Tabla de Datos")
-            
-            # Create table header
-            columns = ("número", "combinaciones")
-            tree = ttk.Treeview(table_tab, columns=columns, show="headings")
-            tree.heading("número", text="Número par")
-            tree.heading("combinaciones", text="Combinaciones")
-            
-            # Add scrollbar
-            scrollbar = ttk.Scrollbar(table_tab, orient=tk.VERTICAL, command=tree.yview)
-            tree.configure(yscrollcommand=scrollbar.set)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            tree.pack(fill=tk.BOTH, expand=True)
-            
-            # Add data to table
-            for num, count in sorted(counts_dict.items()):
-                tree.insert("", tk.END, values=(num, count))
-            
+
+            # Progress indicator while the workers run
+            self._progress_label = ttk.Label(
+                self.range_results_frame,
+                text="Calculando..."
+            )
+            self._progress_label.pack(pady=20)
+
+            # Partition the even numbers across cores; small ranges stay in
+            # one chunk so we don't pay process overhead for trivial work
+            even_count = (end - start) // 2 + 1
+            workers = os.cpu_count() or 1
+            chunks = min(workers, even_count) if even_count >= 64 else 1
+
+            executor = self._get_executor()
+            futures = []
+            chunk_start = start
+            for i in range(chunks):
+                chunk_end = end if i == chunks - 1 else start + 2 * (even_count * (i + 1) // chunks) - 2
+                futures.append(executor.submit(analyze_goldbach_range_cached, chunk_start, chunk_end))
+                chunk_start = chunk_end + 2
+
+            self._range_futures = futures
+            self._range_key = (start, end)
+            self.root.after(50, self._poll_range_analysis)
+
         except ValueError:
             messagebox.showerror("Error", "Por favor ingrese números válidos")
 
+    def _poll_range_analysis(self):
+        """
+        Check whether the submitted range analysis has finished.
+
+        Reschedules itself on the Tk event loop while workers are busy; once
+        every chunk is done, merges the partial results and hands them to
+        _display_range_results. Worker failures surface as an error dialog.
+        If the user navigated away while the workers ran, the pending result
+        is dropped instead of touching destroyed widgets.
+        """
+        futures = self._range_futures
+        if futures is None:
+            return
+
+        if not self.range_results_frame.winfo_exists():
+            self._range_futures = None
+            return
+
+        if not all(future.done() for future in futures):
+            self.root.after(50, self._poll_range_analysis)
+            return
+
+        self._range_futures = None
+        self._progress_label.destroy()
+
+        try:
+            pairs_dict = {}
+            counts_dict = {}
+            for future in futures:
+                chunk_pairs, chunk_counts = future.result()
+                pairs_dict.update(chunk_pairs)
+                counts_dict.update(chunk_counts)
+        except Exception as error:
+            messagebox.showerror("Error", f"El análisis falló: {error}")
+            return
+
+        if not pairs_dict:
+            messagebox.showerror("Error", "No se encontraron resultados para el rango especificado")
+            return
+
+        self._range_cache[self._range_key] = (pairs_dict, counts_dict)
+        self._display_range_results(pairs_dict, counts_dict)
+
+    def _build_range_result_widgets(self):
+        """
+        Create the persistent notebook for the range-analysis screen.
+
+        The notebook, both figures with their embedded canvases and toolbars,
+        and the data table are built once per visit to the screen; every
+        analysis afterwards refreshes their contents in place instead of
+        destroying and re-embedding them, which is by far the most expensive
+        part of displaying results.
+        """
+        # Create notebook for tabs
+        notebook = ttk.Notebook(self.range_results_frame)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Tab 1: Scatter Plot
+        scatter_tab = ttk.Frame(notebook)
+        notebook.add(scatter_tab, text="Gráfico de Dispersión")
+
+        self._scatter_fig = plt.figure(figsize=(10, 6))
+        self._scatter_canvas = FigureCanvasTkAgg(self._scatter_fig, master=scatter_tab)
+        self._scatter_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Add toolbar
+        scatter_toolbar = NavigationToolbar2Tk(self._scatter_canvas, scatter_tab)
+        scatter_toolbar.update()
+
+        # Tab 2: Histogram
+        histogram_tab = ttk.Frame(notebook)
+        notebook.add(histogram_tab, text="Histograma")
+
+        self._histogram_fig = plt.figure(figsize=(10, 6))
+        self._histogram_canvas = FigureCanvasTkAgg(self._histogram_fig, master=histogram_tab)
+        self._histogram_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Add toolbar
+        histogram_toolbar = NavigationToolbar2Tk(self._histogram_canvas, histogram_tab)
+        histogram_toolbar.update()
+
+        # Tab 3: Data Table
+        table_tab = ttk.Frame(notebook)
+        notebook.add(table_tab, text="Tabla de Datos")
+
+        # Create table header
+        columns = ("número", "combinaciones")
+        self._range_tree = ttk.Treeview(table_tab, columns=columns, show="headings")
+        self._range_tree.heading("número", text="Número par")
+        self._range_tree.heading("combinaciones", text="Combinaciones")
+
+        # Add scrollbar
+        scrollbar = ttk.Scrollbar(table_tab, orient=tk.VERTICAL,
+                                  command=self._range_tree.yview)
+        self._range_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._range_tree.pack(fill=tk.BOTH, expand=True)
+
+    def _display_range_results(self, pairs_dict, counts_dict):
+        """
+        Render the visualizations for a completed range analysis.
+
+        The notebook holds three result views — a scatter plot of prime pairs,
+        a histogram of pair counts, and a data table — whose persistent figures
+        and tree are repopulated in place and redrawn lazily via draw_idle.
+
+        Args:
+            pairs_dict (dict): {even_number: [(p1, p2), ...], ...}
+            counts_dict (dict): {even_number: count, ...}
+        """
+        if not self._range_ready:
+            self._build_range_result_widgets()
+            self._range_ready = True
+
+        # Repopulate the persistent figures and schedule their redraws
+        self._scatter_fig.clf()
+        create_scatter_plot(pairs_dict, figure=self._scatter_fig)
+        self._scatter_fig.set_tight_layout(True)
+        self._scatter_canvas.draw_idle()
+
+        self._histogram_fig.clf()
+        create_histogram(counts_dict, figure=self._histogram_fig)
+        self._histogram_fig.set_tight_layout(True)
+        self._histogram_canvas.draw_idle()
+
+        # Refresh the data table in place
+        self._range_tree.delete(*self._range_tree.get_children())
+        for num, count in sorted(counts_dict.items()):
+            self._range_tree.insert("", tk.END, values=(num, count))
+        
+
 if __name__ == "__main__":
+    freeze_support()
     root = tk.Tk()
     app = GoldbachApp(root)
     root.mainloop()
@@ -37,23 +37,31 @@ def create_scatter_plot(pairs_dict, figure=None):
     
     ax = figure.add_subplot(111)
     
-    # Process data for plotting
-    for even_num, pairs in pairs_dict.items():
-        x_values = [pair[0] for pair in pairs]
-        y_values = [pair[1] for pair in pairs]
-        ax.scatter(x_values, y_values, label=f"{even_num}", alpha=0.7)
-    
+    # Stack every pair into flat arrays, colored by its even number, so the
+    # whole plot is a single scatter call (one Artist) instead of one
+    # collection per even number
+    points = np.array(
+        [(p1, p2, even_num)
+         for even_num, pairs in pairs_dict.items()
+         for p1, p2 in pairs],
+        dtype=np.int64
+    ).reshape(-1, 3)
+    scatter = ax.scatter(points[:, 0], points[:, 1], c=points[:, 2],
+                         cmap='viridis', alpha=0.7)
+
     ax.set_xlabel('Primer primo')
     ax.set_ylabel('Segundo primo')
     ax.set_title('Conjetura de Goldbach: pares de primos para números pares')
-    
+
     # Add diagonal line y = x to show symmetry
-    max_val = max([max(pair) for pairs in pairs_dict.values() for pair in pairs]) if pairs_dict else 0
+    max_val = int(points[:, 1].max()) if len(points) else 0
     ax.plot([0, max_val], [0, max_val], 'k--', alpha=0.3)
-    
+
     # Add a legend if there aren't too many numbers
-    if len(pairs_dict) <= 10:
-        ax.legend(title="Número par")
+    if 0 < len(pairs_dict) <= 10:
+        handles, labels = scatter.legend_elements(num=sorted(pairs_dict),
+                                                  fmt="{x:.0f}")
+        ax.legend(handles, labels, title="Número par")
     
     ax.grid(True, alpha=0.3)
     